@@ -54,7 +54,10 @@ async def import_chatgpt_conversations(
         
         # Run import
         importer = ChatGPTImporter(vault, llm)
-        stats = await importer.process_conversations(data)
+        try:
+            stats = await importer.process_conversations(data)
+        finally:
+            await llm.close()
         
         if "error" in stats:
             raise HTTPException(status_code=500, detail=stats["error"])
@@ -14,6 +14,9 @@ class Message:
 
     role: str  # "user", "assistant", "system"
     content: str
+    # Marks the end of a stable prompt prefix for providers with explicit prompt
+    # caching (e.g. {"type": "ephemeral"}); providers without it ignore the field
+    cache_control: dict[str, str] | None = None
 
 
 @dataclass
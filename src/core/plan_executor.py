@@ -3,6 +3,7 @@
 Coordinates tool execution, sanity checking, and specialist escalation.
 """
 
+import asyncio
 import logging
 from collections import defaultdict
 from typing import Any
@@ -15,6 +16,7 @@ from src.core.plan_types import (
 )
 from src.core.sanity_checker import SanityChecker
 from src.core.specialists.verification import SpecialistVerifier
+from src.tools.base_tool import ToolStatus
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,9 @@ logger = logging.getLogger(__name__)
 class PlanExecutor:
     """Executes plans with dependency-aware step ordering."""
 
+    # Tool result data keys checked (in priority order) for sanity-check text
+    SANITY_TEXT_KEYS = ("stdout", "results", "output")
+
     def __init__(
         self,
         tools: dict[str, Any],
@@ -84,6 +89,7 @@ class PlanExecutor:
         tool_results = {}
         specialist_results = {}
         sanity_result = None
+        plan_json = None  # Serialized lazily, once, for specialist escalations
 
         for step in ordered_steps:
             logger.info(f"Executing step: {step.id} ({step.type.value})")
@@ -93,7 +99,7 @@ class PlanExecutor:
                 tool_results[step.id] = result
 
             elif step.type == StepType.SANITY_CHECK:
-                sanity_result = self._execute_sanity_step(step, tool_results, plan.user_query)
+                sanity_result = await self._execute_sanity_step(step, tool_results, plan.user_query)
                 tool_results[step.id] = sanity_result
 
                 # If sanity fails, escalate to specialist
@@ -108,9 +114,12 @@ class PlanExecutor:
                         or sanity_result.get("severity") == "high"
                     )
 
+                    if plan_json is None:
+                        plan_json = plan.to_json()
+
                     verification = await self.specialist_verifier.verify(
                         original_query=plan.user_query,
-                        plan=plan.to_dict(),
+                        plan=plan_json,
                         tool_results=tool_results,
                         sanity_result=sanity_result,
                         use_strong_model=use_strong,
@@ -123,9 +132,12 @@ class PlanExecutor:
                 # Use fast model unless safety_level is high
                 use_strong = plan.safety_level != SafetyLevel.NORMAL
 
+                if plan_json is None:
+                    plan_json = plan.to_json()
+
                 verification = await self.specialist_verifier.verify(
                     original_query=plan.user_query,
-                    plan=plan.to_dict(),
+                    plan=plan_json,
                     tool_results=tool_results,
                     sanity_result=sanity_result or {"suspicious": False, "issues": []},
                     use_strong_model=use_strong,
@@ -184,7 +196,7 @@ class PlanExecutor:
 
             # Convert to dict
             return {
-                "status": "success" if result.status.value == "success" else "failed",
+                "status": "success" if result.status is ToolStatus.SUCCESS else "failed",
                 "data": result.data,
                 "error": result.error,
                 "execution_time_ms": result.execution_time_ms,
@@ -198,7 +210,7 @@ class PlanExecutor:
                 "data": {},
             }
 
-    def _execute_sanity_step(
+    async def _execute_sanity_step(
         self,
         step: PlanStep,
         tool_results: dict[str, Any],
@@ -219,21 +231,25 @@ class PlanExecutor:
 
         # Build response text from tool results
         response_parts = []
+        text_keys = self.SANITY_TEXT_KEYS
+        get_result = tool_results.get
         for step_id in context_steps:
-            if step_id in tool_results:
-                result = tool_results[step_id]
-                if result.get("status") == "success":
-                    data = result.get("data", {})
-                    # Extract text content
-                    if "stdout" in data:
-                        response_parts.append(data["stdout"])
-                    elif "results" in data:
-                        response_parts.append(str(data["results"]))
+            result = get_result(step_id)
+            if not result or result.get("status") != "success":
+                continue
+            data = result.get("data") or {}
+            # Extract text content from the first matching key
+            for key in text_keys:
+                if key in data:
+                    text = data[key]
+                    response_parts.append(text if isinstance(text, str) else str(text))
+                    break
 
         response_text = "\n".join(response_parts)
 
-        # Run sanity check
-        sanity_result = self.sanity_checker.check_response(
+        # Run sanity check off the event loop - it's regex-heavy and synchronous
+        sanity_result = await asyncio.to_thread(
+            self.sanity_checker.check_response,
             response_text=response_text,
             query_text=query_text,
         )
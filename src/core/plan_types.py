@@ -7,6 +7,7 @@ Defines the structured JSON formats for:
 - Finalization
 """
 
+import json
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Literal
@@ -53,7 +54,7 @@ class TrustLevel(str, Enum):
     HIGH = "high"
 
 
-@dataclass
+@dataclass(slots=True)
 class Budget:
     """Cost and latency budget for a plan."""
 
@@ -61,7 +62,7 @@ class Budget:
     latency_tier: Literal["fast", "balanced", "thorough"] = "balanced"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlanStep:
     """A single step in an execution plan."""
 
@@ -76,7 +77,7 @@ class PlanStep:
     can_skip_if_unavailable: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Plan:
     """Complete execution plan from analyzer."""
 
@@ -124,8 +125,12 @@ class Plan:
             ],
         }
 
+    def to_json(self) -> str:
+        """Serialize to a compact JSON string for embedding in model prompts."""
+        return json.dumps(self.to_dict(), separators=(",", ":"))
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolResult:
     """Result from a tool execution."""
 
@@ -137,7 +142,7 @@ class ToolResult:
     execution_time_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     """A source citation."""
 
@@ -147,7 +152,7 @@ class Source:
     trust_level: TrustLevel = TrustLevel.MEDIUM
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifiedSpecs:
     """Verified specifications from specialist."""
 
@@ -158,7 +163,7 @@ class VerifiedSpecs:
     sources: list[Source] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PackCalculation:
     """Battery pack calculations."""
 
@@ -170,7 +175,7 @@ class PackCalculation:
     pack_total_kwh: float
 
 
-@dataclass
+@dataclass(slots=True)
 class RangeEstimate:
     """Vehicle range estimation."""
 
@@ -180,7 +185,7 @@ class RangeEstimate:
     realistic_range_miles: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """An issue detected during processing."""
 
@@ -189,7 +194,7 @@ class Issue:
     severity: Literal["info", "warning", "error"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Confidence:
     """Confidence levels for different aspects."""
 
@@ -199,7 +204,7 @@ class Confidence:
     range: ConfidenceLevel = ConfidenceLevel.MEDIUM
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Complete verification result from specialist."""
 
@@ -268,7 +273,7 @@ class VerificationResult:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalizationInput:
     """Input for the finalization step."""
 
@@ -282,7 +287,7 @@ class FinalizationInput:
     conversation_history: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalizationOutput:
     """Output from finalization."""
 
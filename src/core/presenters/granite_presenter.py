@@ -3,16 +3,117 @@
 Takes structured results and generates natural language answers.
 """
 
+import asyncio
+import itertools
 import json
 import logging
+import re
+import weakref
 from typing import Any
 
-from src.core.llm_connector import LLMConnector, Message
-from src.core.plan_types import FinalizationOutput
+from src.core.llm_connector import LLMConnector, LLMResponse, Message
+from src.core.plan_types import FinalizationOutput, VerificationResult
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import regex
+
+    REGEX_AVAILABLE = True
+except ImportError:
+    REGEX_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when available.
+
+    The model doesn't need pretty-printing, and indentation roughly doubles
+    prompt size for large tool results.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON, using orjson when available.
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON (orjson's error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _find_object_end(text: str, start: int) -> int:
+    """Find the } that closes the JSON object opening at text[start].
+
+    Walks only the structural characters, tracking brace depth and skipping
+    braces inside strings.
+
+    Returns:
+        Index of the closing brace, or -1 if the object is never closed
+    """
+    depth = 0
+    in_string = False
+    escaped = -1  # Position of a character escaped by a backslash
+    for match in _JSON_STRUCTURE_RE.finditer(text, start):
+        pos = match.start()
+        if pos == escaped:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped = pos + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return pos
+    return -1
+
+
+def _successful_results(tool_results: dict[str, Any]) -> dict[str, Any]:
+    """Index the tool results that succeeded, keeping step order.
+
+    Built once per finalize so the citation map and the fallback answer don't
+    each re-filter every step by status.
+    """
+    return {
+        step_id: result
+        for step_id, result in tool_results.items()
+        if result.get("status") == "success"
+    }
+
+
+def _first_sentence(text: str, max_chars: int = 120) -> str:
+    """Take the opening sentence of a prose answer as its one-line summary.
+
+    Args:
+        text: Answer text
+        max_chars: Longest summary returned
+
+    Returns:
+        First sentence of the first line, cut to max_chars
+    """
+    line = text.strip().split("\n", 1)[0]
+    match = _SENTENCE_END_RE.search(line)
+    return (line[: match.start()] if match else line)[:max_chars]
+
+
 PRESENTER_SYSTEM_PROMPT = """You are Kai.
 VIBE: Witty, slightly rebellious, smart, and authentic. You are NOT a customer service bot.
 You speak like a real person on Discord or Twitter. You use lowercase when appropriate.
@@ -32,10 +133,220 @@ If the user is chaotic, match their energy.
 If the user is venting, be present and thoughtful - don't rush to wrap up.
 """
 
+QUICK_SYSTEM_PROMPT = """You are Kai.
+VIBE: Witty, slightly rebellious, smart, and authentic.
+You speak like a real person. You use lowercase when appropriate.
+You have opinions. You roast lightly if the user invites it.
+NEVER say "As an AI".
+NEVER lecture.
+Keep it short.
+"""
+
+PRESENTER_JSON_INSTRUCTIONS = """
+
+OUTPUT FORMAT:
+Respond with ONLY a JSON object - no markdown fences, no text around it:
+{"short_summary": "one-line summary", "final_answer": "your full answer", "citations_used": [1, 2]}
+citations_used lists the ids from "citations" that your answer relies on.
+"""
+
+# Fallback answer when neither the model nor the tool results produced anything usable
+_GENERIC_ERROR_ANSWER = (
+    "I apologize, but I encountered a formatting issue. Please try rephrasing your question."
+)
+
+# JSON schema for the finalization object. Backends that support structured
+# output decode against it directly; the instructions above cover the rest
+_FINALIZATION_SCHEMA = {
+    "type": "object",
+    "required": ["short_summary", "final_answer", "citations_used"],
+    "properties": {
+        "short_summary": {"type": "string"},
+        "final_answer": {"type": "string"},
+        "citations_used": {"type": "array", "items": {"type": "integer"}},
+    },
+    "additionalProperties": False,
+}
+
+# The regex module runs the substitution passes below faster than re (same API)
+_md_re = regex if REGEX_AVAILABLE else re
+
+# Markdown removal passes for _strip_markdown, applied in order. Each pass only
+# runs when one of its marker substrings is present, since it can't match otherwise
+_MARKDOWN_SUBS = (
+    # Bold/italic markers
+    (("*",), _md_re.compile(r"\*{1,3}([^*]+)\*{1,3}"), r"\1"),
+    (("_",), _md_re.compile(r"_{1,3}([^_]+)_{1,3}"), r"\1"),
+    # Headers (keep the text)
+    (("#",), _md_re.compile(r"^#{1,6}\s+(.+)$", _md_re.MULTILINE), r"\1"),
+    # Code blocks and inline code
+    (("```",), _md_re.compile(r"```[^`]*```", _md_re.DOTALL), ""),
+    (("`",), _md_re.compile(r"`([^`]+)`"), r"\1"),
+    # Horizontal rules
+    (("-", "_", "*"), _md_re.compile(r"^[\-_*]{3,}$", _md_re.MULTILINE), ""),
+    # Blockquotes
+    ((">",), _md_re.compile(r"^>\s*(.+)$", _md_re.MULTILINE), r"\1"),
+    # Tables (pipe-delimited rows, then separator rows)
+    (("|",), _md_re.compile(r"^\|.+\|\s*$", _md_re.MULTILINE), ""),
+    (("|",), _md_re.compile(r"^\|[\s\-:]+\|\s*$", _md_re.MULTILINE), ""),
+    # List markers
+    (("-", "*", "+"), _md_re.compile(r"^[\s]*[-*+]\s+", _md_re.MULTILINE), ""),
+    ((".",), _md_re.compile(r"^[\s]*\d+\.\s+", _md_re.MULTILINE), ""),
+    # Extra whitespace, preserving paragraph breaks
+    (("\n\n\n",), _md_re.compile(r"\n{3,}"), "\n\n"),
+    (("  ",), _md_re.compile(r" {2,}"), " "),
+)
+
+# Matches if any _MARKDOWN_SUBS pass could change the text; clean prose (the
+# common case, since the prompt asks for no markdown) skips them all
+_MARKDOWN_PROBE_RE = re.compile(r"[*_#`>|+-]|^\s*\d+\.\s|\n\n\n|  ", re.MULTILINE)
+
+# Tool data that only matters for logging/ranking, never for the answer
+_OMITTED_DATA_KEYS = frozenset({"enhanced_query", "sources_used", "total_results"})
+
+# Citations assumed for raw prose fallback answers (up to 5)
+_RAW_RESPONSE_CITATIONS = (1, 2, 3, 4, 5)
+
+# Fenced code blocks dropped from raw prose fallback answers
+_CODE_BLOCK_RE = re.compile(r"```[\w]*\n.*?\n```", re.DOTALL)
+
+# Whitespace after sentence-ending punctuation
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s")
+
+# Characters that affect JSON object nesting
+_JSON_STRUCTURE_RE = re.compile(r'[{}"\\]')
+
+# Opening of the final_answer value, and the complete-escape prefix of a JSON
+# string body, for filtering JSON answers out of finalize_stream
+_FINAL_ANSWER_KEY_RE = re.compile(r'"final_answer"\s*:\s*"')
+_JSON_STRING_BODY_RE = re.compile(r'(?:[^"\\]|\\u[0-9a-fA-F]{4}|\\[^u])*')
+_HIGH_SURROGATE_ESCAPE_RE = re.compile(r"\\u[dD][89abAB][0-9a-fA-F]{2}$")
+_STREAM_MARKDOWN_TABLE = str.maketrans("", "", "*`")
+
+# System prompts are the stable prefix of every presenter call; mark them for
+# providers with explicit prompt caching
+_PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Shared system messages for the common case of no learned preferences
+_SYSTEM_MESSAGE = Message(
+    role="system", content=PRESENTER_SYSTEM_PROMPT, cache_control=_PROMPT_CACHE_CONTROL
+)
+_JSON_SYSTEM_MESSAGE = Message(
+    role="system",
+    content=PRESENTER_SYSTEM_PROMPT + PRESENTER_JSON_INSTRUCTIONS,
+    cache_control=_PROMPT_CACHE_CONTROL,
+)
+_QUICK_SYSTEM_MESSAGE = Message(
+    role="system", content=QUICK_SYSTEM_PROMPT, cache_control=_PROMPT_CACHE_CONTROL
+)
+
+
+class _FinalAnswerStreamFilter:
+    """Reduces a streamed response to its final_answer text.
+
+    finalize_stream asks for prose, but the model sometimes answers with the
+    JSON object anyway. When the response opens like JSON, only the decoded
+    final_answer string is passed on, as it arrives, with emphasis and code
+    markers dropped. Anything else passes through unchanged.
+    """
+
+    # Give up looking for the final_answer key after this many characters
+    SCAN_CHARS = 256
+
+    def __init__(self):
+        self._buffer = ""
+        self._state = "detect"  # detect -> (passthrough | key -> value -> done)
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the model response
+
+        Returns:
+            Text to show the user for this chunk (possibly empty)
+        """
+        if self._state == "passthrough":
+            return chunk
+        if self._state == "done":
+            return ""
+
+        self._buffer += chunk
+
+        if self._state == "detect":
+            head = self._buffer.lstrip()
+            if not head:
+                return ""
+            if head[0] not in "{`":
+                return self._pass_through()
+            self._state = "key"
+
+        if self._state == "key":
+            match = _FINAL_ANSWER_KEY_RE.search(self._buffer)
+            if not match:
+                if len(self._buffer) > self.SCAN_CHARS:
+                    return self._pass_through()
+                return ""
+            self._buffer = self._buffer[match.end() :]
+            self._state = "value"
+
+        return self._drain_value()
+
+    def flush(self) -> str:
+        """Return whatever is still buffered once the stream has ended."""
+        if self._state in ("detect", "key"):
+            return self._pass_through()
+        return ""
+
+    def _pass_through(self) -> str:
+        self._state = "passthrough"
+        text, self._buffer = self._buffer, ""
+        return text
+
+    def _drain_value(self) -> str:
+        body = _JSON_STRING_BODY_RE.match(self._buffer).group()
+        end = len(body)
+        if end < len(self._buffer) and self._buffer[end] == '"':
+            self._state = "done"
+        elif _HIGH_SURROGATE_ESCAPE_RE.search(body):
+            # Keep a split surrogate pair together for the next chunk
+            end -= 6
+        self._buffer = self._buffer[end:]
+        if not end:
+            return ""
+        try:
+            text = json.loads(f'"{body[:end]}"', strict=False)
+        except json.JSONDecodeError:
+            text = body[:end]  # Invalid escape; show it as written
+        return text.translate(_STREAM_MARKDOWN_TABLE)
+
 
 class GranitePresenter:
     """Generates final user-facing responses using Granite."""
 
+    # Token budget for a single finalization response: a base allowance plus
+    # room per citation and for long (venting/story) queries, capped
+    FINALIZE_BASE_TOKENS = 512
+    FINALIZE_TOKENS_PER_CITATION = 64
+    FINALIZE_MAX_TOKENS = 2048
+
+    # Longest search snippet forwarded to the model per citation
+    SNIPPET_MAX_CHARS = 300
+
+    # Most recent history turns embedded in the finalize prompt, and the longest
+    # any one of them may be
+    HISTORY_MAX_TURNS = 6
+    HISTORY_MESSAGE_MAX_CHARS = 1000
+
+    # finalize_stream coalesces model tokens, yielding once this much text is
+    # pending or this long has passed since the last yield
+    STREAM_FLUSH_CHARS = 32
+    STREAM_FLUSH_INTERVAL_S = 0.016
+
+    # Responses longer than this are parsed in a worker thread so a slow parse
+    # doesn't stall other requests; shorter ones aren't worth the thread hop
+    PARSE_OFFLOAD_CHARS = 8192
+
     def __init__(self, connector: LLMConnector, memory_vault=None):
         """Initialize presenter.
 
@@ -46,6 +357,13 @@ class GranitePresenter:
         self.connector = connector
         self.memory_vault = memory_vault
         self._cached_preferences = None
+        # Serializes the first vault read so concurrent requests share it. Locks
+        # are bound to the event loop that uses them, so keep one per loop
+        self._preferences_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
+        # System messages with learned preferences appended, keyed by base prompt
+        self._preference_messages: dict[str, Message] = {}
         
     def _get_learned_preferences(self) -> str:
         """Extract top 5 learned preferences from memory vault.
@@ -95,79 +413,276 @@ class GranitePresenter:
             logger.warning(f"Failed to load learned preferences: {e}")
             return ""
 
-    async def finalize(
+    async def _load_learned_preferences(self) -> None:
+        """Warm the learned preferences cache without blocking the event loop.
+
+        Only the first load reads the memory vault; concurrent callers wait for
+        it instead of each querying the vault, and later calls are no-ops.
+        """
+        if not self.memory_vault or self._cached_preferences is not None:
+            return
+        loop = asyncio.get_running_loop()
+        lock = self._preferences_locks.get(loop)
+        if lock is None:
+            lock = self._preferences_locks[loop] = asyncio.Lock()
+        async with lock:
+            if self._cached_preferences is None:
+                await asyncio.to_thread(self._get_learned_preferences)
+
+    def invalidate_preferences(self) -> None:
+        """Drop cached learned preferences so the next call reloads them from the vault."""
+        self._cached_preferences = None
+        self._preference_messages.clear()
+
+    def _get_system_message(self, json_output: bool = False) -> Message:
+        """Build the presenter system message with learned preferences injected.
+
+        Args:
+            json_output: Append the structured JSON output instructions
+
+        Returns:
+            System message for the presenter model
+        """
+        return self._with_learned_preferences(
+            _JSON_SYSTEM_MESSAGE if json_output else _SYSTEM_MESSAGE
+        )
+
+    def _with_learned_preferences(self, shared: Message) -> Message:
+        """Append learned preferences to a shared system message.
+
+        The combined message is built once and reused until
+        invalidate_preferences() is called.
+
+        Args:
+            shared: Module-level system message
+
+        Returns:
+            The shared message itself when there are no learned preferences
+        """
+        learned_prefs = self._get_learned_preferences()
+        if not learned_prefs:
+            return shared
+
+        message = self._preference_messages.get(shared.content)
+        if message is None:
+            # Preferences go last so the static instructions stay a common prefix
+            # that backends can reuse from their prompt cache
+            message = Message(
+                role="system",
+                content=shared.content + learned_prefs,
+                cache_control=_PROMPT_CACHE_CONTROL,
+            )
+            self._preference_messages[shared.content] = message
+        return message
+
+    def _prepare_input(
         self,
         original_query: str,
-        plan: dict[str, Any],
         tool_results: dict[str, Any],
+        successful_results: dict[str, Any],
         specialist_results: dict[str, Any],
-        conversation_history: list[dict[str, Any]] | None = None,
-        style_profile: str = "kai_default",
-    ) -> FinalizationOutput:
-        """Generate final answer from structured results.
+        conversation_history: list[dict[str, Any]] | None,
+        json_output: bool = True,
+    ) -> tuple[list, list[Message]]:
+        """Build the citation map and prompt messages for finalization.
+
+        Shared by finalize and finalize_stream. Specialist results only
+        contribute citations; the model never sees them directly.
 
         Args:
             original_query: User's original query
-            plan: Execution plan that was followed
             tool_results: Results from tool executions
+            successful_results: Successful subset of tool_results
             specialist_results: Results from specialist models
             conversation_history: Recent conversation messages for context
-            style_profile: Style profile to use
+            json_output: Ask the model for the structured JSON output format
 
         Returns:
-            FinalizationOutput with final answer
+            Tuple of (citation map, messages for the presenter model)
         """
         # Build citation map
-        citation_map = self._build_citation_map(tool_results, specialist_results)
-
-        # Serialize specialist results for JSON
-        serialized_specialist_results = {}
-        for key, value in specialist_results.items():
-            if hasattr(value, "to_dict"):
-                serialized_specialist_results[key] = value.to_dict()
-            elif isinstance(value, dict):
-                serialized_specialist_results[key] = value
-            else:
-                # Convert dataclasses and other objects
-                serialized_specialist_results[key] = str(value)
+        citation_map = self._build_citation_map(successful_results, specialist_results)
 
         # Build finalization input - SIMPLIFIED to reduce prompt complexity
         # Only send what Granite actually needs to see
         simplified_input = {
             "original_query": original_query,
-            "tool_results": tool_results,
+            "tool_results": self._compact_tool_results(tool_results),
             "citations": citation_map,
-            "conversation_history": conversation_history or [],
         }
-        
-        # Inject learned preferences into system prompt
-        learned_prefs = self._get_learned_preferences()
-        augmented_system_prompt = PRESENTER_SYSTEM_PROMPT + learned_prefs
 
-        # Call Granite presenter
+        # Follow-ups ("yes, 14s", "what about the 40T?") only make sense with the
+        # recent turns, so history always goes in, trimmed to bound the prompt
+        if conversation_history:
+            simplified_input["conversation_history"] = self._trim_history(conversation_history)
+
         messages = [
-            Message(role="system", content=augmented_system_prompt),
-            Message(role="user", content=json.dumps(simplified_input, indent=2)),
+            self._get_system_message(json_output=json_output),
+            Message(role="user", content=_json_dumps(simplified_input)),
         ]
 
+        return citation_map, messages
+
+    async def finalize(
+        self,
+        original_query: str,
+        plan: dict[str, Any],
+        tool_results: dict[str, Any],
+        specialist_results: dict[str, Any],
+        conversation_history: list[dict[str, Any]] | None = None,
+        style_profile: str = "kai_default",
+    ) -> FinalizationOutput:
+        """Generate final answer from structured results.
+
+        Args:
+            original_query: User's original query
+            plan: Execution plan that was followed
+            tool_results: Results from tool executions
+            specialist_results: Results from specialist models
+            conversation_history: Recent conversation messages for context
+            style_profile: Style profile to use
+
+        Returns:
+            FinalizationOutput with final answer
+        """
+        # Nothing to present: skip the structured envelope and just converse
+        if not tool_results and not specialist_results:
+            return await self._finalize_conversation(original_query, conversation_history)
+
+        # Prompt assembly is pure CPU (plus a preferences file read), so keep it
+        # off the event loop while other requests are in flight
+        successful_results = _successful_results(tool_results)
+        await self._load_learned_preferences()
+        citation_map, messages = await asyncio.to_thread(
+            self._prepare_input,
+            original_query,
+            tool_results,
+            successful_results,
+            specialist_results,
+            conversation_history,
+        )
+
+        return await self._complete_finalization(
+            original_query,
+            tool_results,
+            successful_results,
+            specialist_results,
+            citation_map,
+            messages,
+        )
+
+    async def _finalize_conversation(
+        self,
+        original_query: str,
+        conversation_history: list[dict[str, Any]] | None,
+    ) -> FinalizationOutput:
+        """Answer in prose when there are no results to present.
+
+        With no tool or specialist results there is nothing to cite or verify,
+        so the JSON payload, output instructions and parse step are pure overhead.
+        The presenter prompt and budget stay the same, so long vents and stories
+        still get a full answer.
+
+        Args:
+            original_query: User's original query
+            conversation_history: Recent conversation messages for context
+
+        Returns:
+            FinalizationOutput with the model's prose answer
+        """
+        await self._load_learned_preferences()
+        messages = self._build_quick_messages(
+            original_query,
+            self._trim_history(conversation_history or []),
+            base_system=_SYSTEM_MESSAGE,
+        )
         try:
             response = await self.connector.generate(
                 messages=messages,
-                temperature=0.3,  # Focused for concise output
-                max_tokens=2048,  # Allow longer formatted responses
+                temperature=0.3,
+                max_tokens=self.FINALIZE_MAX_TOKENS,
             )
+        except Exception as e:
+            logger.error(f"Conversational finalization failed: {e}", exc_info=True)
+            return self._create_fallback_output(original_query, {}, {}, {})
+
+        final_answer = self._strip_markdown(response.content)
+        return FinalizationOutput(
+            final_answer=final_answer,
+            short_summary=_first_sentence(final_answer),
+            debug_info={"used_tools": [], "used_specialists": [], "citation_count": 0},
+        )
+
+    async def _complete_finalization(
+        self,
+        original_query: str,
+        tool_results: dict[str, Any],
+        successful_results: dict[str, Any],
+        specialist_results: dict[str, Any],
+        citation_map: list,
+        messages: list[Message],
+    ) -> FinalizationOutput:
+        """Call the presenter model and turn its response into a FinalizationOutput.
+
+        Args:
+            original_query: User's original query
+            tool_results: Results from tool executions
+            successful_results: Successful subset of tool_results
+            specialist_results: Results from specialist models
+            citation_map: Citation map sent to the model
+            messages: Prompt messages for the model
+
+        Returns:
+            FinalizationOutput, or a fallback output if generation fails
+        """
+        try:
+            max_tokens = self._finalize_max_tokens(original_query, citation_map)
+            response = await self._generate_finalization(messages, max_tokens)
+            if response.finish_reason == "length" and max_tokens < self.FINALIZE_MAX_TOKENS:
+                # The sized budget was too tight for this answer; retry once at
+                # the cap rather than settle for a cut-off one
+                logger.info(f"Finalization hit max_tokens={max_tokens}, retrying at the cap")
+                response = await self._generate_finalization(messages, self.FINALIZE_MAX_TOKENS)
+            content = response.content
 
             # Log raw response for debugging
-            logger.debug(f"Granite presenter raw output:\n{response.content}")
+            logger.debug("Granite presenter raw output:\n%s", content)
 
             # Parse response
-            output_dict = self._parse_finalization_json(response.content)
+            offload = len(content) > self.PARSE_OFFLOAD_CHARS
+            if offload:
+                output_dict = await asyncio.to_thread(self._parse_finalization_json, content)
+            else:
+                output_dict = self._parse_finalization_json(content)
 
             if not output_dict:
+                # A response cut off by the token budget still carries most of
+                # its answer; keep that rather than rebuilding one from results
+                partial_answer = self._recover_final_answer(content)
+                if partial_answer:
+                    logger.warning("Finalization JSON was incomplete, using partial answer")
+                    return FinalizationOutput(
+                        final_answer=self._strip_markdown(partial_answer),
+                        short_summary="",
+                        debug_info={
+                            "used_tools": list(tool_results.keys()),
+                            "used_specialists": list(specialist_results.keys()),
+                            "citation_count": len(citation_map),
+                            "truncated": True,
+                        },
+                    )
+
                 logger.error("Failed to parse finalization JSON, using fallback")
-                return self._create_fallback_output(
-                    original_query, tool_results, specialist_results, raw_response=response.content
+                fallback_args = (
+                    original_query,
+                    tool_results,
+                    successful_results,
+                    specialist_results,
+                    content,
                 )
+                if offload:
+                    return await asyncio.to_thread(self._create_fallback_output, *fallback_args)
+                return self._create_fallback_output(*fallback_args)
 
             # Convert to FinalizationOutput
             final_answer = output_dict.get("final_answer", "")
@@ -188,55 +703,161 @@ class GranitePresenter:
 
         except Exception as e:
             logger.error(f"Finalization failed: {e}", exc_info=True)
-            return self._create_fallback_output(original_query, tool_results, specialist_results)
+            return self._create_fallback_output(
+                original_query, tool_results, successful_results, specialist_results
+            )
+
+    def _finalize_max_tokens(self, original_query: str, citation_map: list) -> int:
+        """Size the response token budget to the expected answer length.
+
+        Backends reserve KV cache proportional to max_tokens, so a tight budget
+        for short answers leaves more room for concurrent requests.
+
+        Args:
+            original_query: User's original query
+            citation_map: Citations available to the answer
+
+        Returns:
+            max_tokens for the finalization call
+        """
+        budget = (
+            self.FINALIZE_BASE_TOKENS
+            + self.FINALIZE_TOKENS_PER_CITATION * len(citation_map)
+            + len(original_query) // 4  # Roughly the query's own token count
+        )
+        return min(budget, self.FINALIZE_MAX_TOKENS)
+
+    async def _generate_finalization(self, messages: list[Message], max_tokens: int) -> LLMResponse:
+        """Run the finalization model call.
+
+        Args:
+            messages: System and user messages for the presenter model
+            max_tokens: Response token budget
+
+        Returns:
+            Model response
+        """
+        return await self.connector.generate(
+            messages=messages,
+            temperature=0.3,  # Focused for concise output
+            max_tokens=max_tokens,
+            json_mode=True,  # Grammar-constrained output where the backend supports it
+            json_schema=_FINALIZATION_SCHEMA,
+        )
+
+    def _trim_history(self, history: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Keep the most recent history turns, capping each message's length.
+
+        Args:
+            history: Conversation messages, oldest first
+
+        Returns:
+            Trimmed copy of the history; the input is not modified
+        """
+        max_chars = self.HISTORY_MESSAGE_MAX_CHARS
+        trimmed = []
+        for msg in history[-self.HISTORY_MAX_TURNS :]:
+            content = msg.get("content")
+            if isinstance(content, str) and len(content) > max_chars:
+                msg = {**msg, "content": content[:max_chars]}
+            trimmed.append(msg)
+        return trimmed
+
+    def _compact_tool_results(self, tool_results: dict[str, Any]) -> dict[str, Any]:
+        """Project tool results down to what the model needs to write the answer.
+
+        Failed steps keep only their status and error. Successful steps drop
+        timing and search bookkeeping. Their search citations shrink to the
+        citation id and a truncated snippet, since labels and URLs are already in
+        the payload's citation list. The input is not modified.
+
+        Args:
+            tool_results: Tool results
+
+        Returns:
+            Compact tool results, keyed by step id
+        """
+        max_chars = self.SNIPPET_MAX_CHARS
+        citation_ids = itertools.count(1)  # Same numbering as _build_citation_map
+        compacted = {}
+        for step_id, result in tool_results.items():
+            status = result.get("status")
+            if status != "success":
+                compacted[step_id] = {"status": status, "error": result.get("error")}
+                continue
+
+            data = result.get("data")
+            if not isinstance(data, dict):
+                compacted[step_id] = {"status": status, "data": data}
+                continue
+
+            summary = {key: value for key, value in data.items() if key not in _OMITTED_DATA_KEYS}
+            citations = data.get("citations")
+            if citations:
+                summary["citations"] = [
+                    {
+                        "id": next(citation_ids),
+                        "snippet": (citation.get("snippet") or "")[:max_chars],
+                    }
+                    for citation in citations
+                ]
+            compacted[step_id] = {"status": status, "data": summary}
+        return compacted
 
     def _build_citation_map(
         self,
-        tool_results: dict[str, Any],
+        successful_results: dict[str, Any],
         specialist_results: dict[str, Any],
     ) -> list:
         """Build citation map from results.
 
         Args:
-            tool_results: Tool results
+            successful_results: Successful tool results (see _successful_results)
             specialist_results: Specialist results
 
         Returns:
             List of citation dicts
         """
-        citations = []
-        citation_id = 1
+        # Nothing citable (small talk, failed tools): skip the generator entirely
+        if not successful_results and "verification" not in specialist_results:
+            return []
+
+        return [
+            {"id": citation_id, "label": label, "url": url}
+            for citation_id, (label, url, _) in enumerate(
+                self._iter_citation_sources(successful_results, specialist_results), start=1
+            )
+        ]
+
+    def _iter_citation_sources(
+        self,
+        successful_results: dict[str, Any],
+        specialist_results: dict[str, Any],
+    ):
+        """Yield every citable source, in citation order.
+
+        Args:
+            successful_results: Successful tool results
+            specialist_results: Specialist results
 
+        Yields:
+            Tuples of (label, url, snippet); snippet is empty for specialist sources
+        """
         # Extract from web search results
-        for _step_id, result in tool_results.items():
-            if result.get("status") == "success":
-                data = result.get("data", {})
-                if "citations" in data:
-                    for citation in data["citations"]:
-                        citations.append(
-                            {
-                                "id": citation_id,
-                                "label": citation.get("title", "Source"),
-                                "url": citation.get("url", ""),
-                            }
-                        )
-                        citation_id += 1
+        for result in successful_results.values():
+            data = result.get("data") or {}
+            for citation in data.get("citations", ()):
+                yield (
+                    citation.get("title", "Source"),
+                    citation.get("url", ""),
+                    citation.get("snippet", ""),
+                )
 
         # Extract from specialist verification
-        if "verification" in specialist_results:
-            verification = specialist_results["verification"]
-            if hasattr(verification, "verified_specs") and verification.verified_specs:
-                for source in verification.verified_specs.sources:
-                    citations.append(
-                        {
-                            "id": citation_id,
-                            "label": source.label,
-                            "url": source.url,
-                        }
-                    )
-                    citation_id += 1
-
-        return citations
+        verification = specialist_results.get("verification")
+        if isinstance(verification, VerificationResult) and verification.verified_specs:
+            for source in verification.verified_specs.sources:
+                yield source.label, source.url, ""
 
     def _strip_markdown(self, text: str) -> str:
         """Remove any markdown formatting for clean book-like prose.
@@ -247,36 +868,12 @@ class GranitePresenter:
         Returns:
             Clean text without markdown formatting
         """
-        import re
-
-        # Remove bold/italic markers
-        text = re.sub(r'\*{1,3}([^*]+)\*{1,3}', r'\1', text)
-        text = re.sub(r'_{1,3}([^_]+)_{1,3}', r'\1', text)
-
-        # Remove headers (keep the text)
-        text = re.sub(r'^#{1,6}\s+(.+)$', r'\1', text, flags=re.MULTILINE)
-
-        # Remove code blocks
-        text = re.sub(r'```[^`]*```', '', text, flags=re.DOTALL)
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-
-        # Remove horizontal rules
-        text = re.sub(r'^[\-_*]{3,}$', '', text, flags=re.MULTILINE)
-
-        # Remove blockquotes
-        text = re.sub(r'^>\s*(.+)$', r'\1', text, flags=re.MULTILINE)
-
-        # Remove markdown tables (pipe-delimited)
-        text = re.sub(r'^\|.+\|\s*$', '', text, flags=re.MULTILINE)  # Table rows
-        text = re.sub(r'^\|[\s\-:]+\|\s*$', '', text, flags=re.MULTILINE)  # Separator rows
+        if not _MARKDOWN_PROBE_RE.search(text):
+            return text.strip()
 
-        # Remove list markers (convert to plain text)
-        text = re.sub(r'^[\s]*[-*+]\s+', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^[\s]*\d+\.\s+', '', text, flags=re.MULTILINE)
-
-        # Clean up extra whitespace while preserving paragraph breaks
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r' {2,}', ' ', text)
+        for markers, pattern, replacement in _MARKDOWN_SUBS:
+            if any(marker in text for marker in markers):
+                text = pattern.sub(replacement, text)
 
         return text.strip()
 
@@ -289,38 +886,57 @@ class GranitePresenter:
         Returns:
             Parsed dict or None
         """
-        # Try direct parse
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            pass
-
-        # Try extracting from markdown
-        import re
-
-        json_pattern = r"```(?:json)?\s*(\{.*?\})\s*```"
-        matches = re.findall(json_pattern, response, re.DOTALL)
-
-        if matches:
-            try:
-                return json.loads(matches[0])
-            except json.JSONDecodeError:
-                pass
-
-        # Try finding first { to last }
         start = response.find("{")
-        end = response.rfind("}")
 
-        if start != -1 and end != -1 and end > start:
-            try:
-                return json.loads(response[start : end + 1])
-            except json.JSONDecodeError:
-                pass
+        if start != -1:
+            # Fast path: response is bare JSON, so parse it without scanning further.
+            # Text that doesn't end in } can't be an object; skip the doomed parse.
+            attempted = None
+            if start == 0 or response[:start].isspace():
+                stripped = response[start:].rstrip()
+                if stripped.endswith("}"):
+                    attempted = stripped
+                    try:
+                        return _json_loads(attempted)
+                    except json.JSONDecodeError:
+                        pass
+
+            # The balanced object opening at the first {, wherever it sits (after a
+            # preamble, inside a fence), unless the fast path already rejected it
+            end = _find_object_end(response, start)
+            if end != -1:
+                candidate = response[start : end + 1]
+                if candidate != attempted:
+                    try:
+                        return _json_loads(candidate)
+                    except json.JSONDecodeError:
+                        pass
 
         # Log the problematic response for debugging
-        logger.warning(f"Failed to parse finalization JSON. Response preview: {response[:300]}...")
+        logger.warning("Failed to parse finalization JSON. Response preview: %.300s...", response)
         return None
 
+    def _recover_final_answer(self, response: str) -> str:
+        """Extract the final_answer text from an unterminated JSON response.
+
+        Args:
+            response: Raw response text that failed to parse
+
+        Returns:
+            The decoded final_answer prefix, or an empty string if there is none
+        """
+        match = _FINAL_ANSWER_KEY_RE.search(response)
+        if not match:
+            return ""
+        body = _JSON_STRING_BODY_RE.match(response, match.end()).group()
+        if _HIGH_SURROGATE_ESCAPE_RE.search(body):
+            body = body[:-6]  # Half of a surrogate pair
+        try:
+            text = json.loads(f'"{body}"', strict=False)
+        except json.JSONDecodeError:
+            text = body
+        return text.strip()
+
     async def finalize_stream(
         self,
         original_query: str,
@@ -343,37 +959,30 @@ class GranitePresenter:
         Yields:
             Content chunks as they are generated
         """
-        # Build citation map
-        citation_map = self._build_citation_map(tool_results, specialist_results)
-
-        # Serialize specialist results
-        serialized_specialist_results = {}
-        for key, value in specialist_results.items():
-            if hasattr(value, "to_dict"):
-                serialized_specialist_results[key] = value.to_dict()
-            elif isinstance(value, dict):
-                serialized_specialist_results[key] = value
-            else:
-                serialized_specialist_results[key] = str(value)
-
-        # Build simplified input
-        simplified_input = {
-            "original_query": original_query,
-            "tool_results": tool_results,
-            "citations": citation_map,
-            "conversation_history": conversation_history or [],
-        }
-        
-        # Inject learned preferences into system prompt
-        learned_prefs = self._get_learned_preferences()
-        augmented_system_prompt = PRESENTER_SYSTEM_PROMPT + learned_prefs
-
-        # Call Granite presenter in streaming mode
-        messages = [
-            Message(role="system", content=augmented_system_prompt),
-            Message(role="user", content=json.dumps(simplified_input, indent=2)),
-        ]
+        await self._load_learned_preferences()
+        if not tool_results and not specialist_results:
+            # Nothing to present: send the query itself rather than a payload
+            messages = self._build_quick_messages(
+                original_query,
+                self._trim_history(conversation_history or []),
+                base_system=_SYSTEM_MESSAGE,
+            )
+        else:
+            _, messages = await asyncio.to_thread(
+                self._prepare_input,
+                original_query,
+                tool_results,
+                _successful_results(tool_results),
+                specialist_results,
+                conversation_history,
+                json_output=False,
+            )
 
+        answer_filter = _FinalAnswerStreamFilter()
+        loop = asyncio.get_running_loop()
+        pending = []
+        pending_chars = 0
+        last_flush = loop.time()
         try:
             # Stream from connector
             async for chunk in self.connector.generate_stream(
@@ -381,19 +990,39 @@ class GranitePresenter:
                 temperature=0.3,  # Focused for concise output
                 max_tokens=2048,  # Allow longer formatted responses
             ):
-                yield chunk
+                text = answer_filter.feed(chunk)
+                if not text:
+                    continue
+                pending.append(text)
+                pending_chars += len(text)
+
+                now = loop.time()
+                if (
+                    pending_chars >= self.STREAM_FLUSH_CHARS
+                    or now - last_flush >= self.STREAM_FLUSH_INTERVAL_S
+                ):
+                    yield "".join(pending)
+                    pending.clear()
+                    pending_chars = 0
+                    last_flush = now
+
+            pending.append(answer_filter.flush())
+            if any(pending):
+                yield "".join(pending)
 
         except Exception as e:
             logger.error(f"Streaming finalization failed: {e}", exc_info=True)
+            # Don't drop text that was already generated
+            if any(pending):
+                yield "".join(pending)
             # Fallback to simple answer
-            fallback_msg = "I apologize, but I encountered an error formatting the response."
-            for char in fallback_msg:
-                yield char
+            yield "I apologize, but I encountered an error formatting the response."
 
     def _create_fallback_output(
         self,
         query: str,
         tool_results: dict[str, Any],
+        successful_results: dict[str, Any],
         specialist_results: dict[str, Any],
         raw_response: str | None = None,
     ) -> FinalizationOutput:
@@ -402,6 +1031,7 @@ class GranitePresenter:
         Args:
             query: Original query
             tool_results: Tool results
+            successful_results: Successful subset of tool_results
             specialist_results: Specialist results
             raw_response: Raw model response that failed JSON parsing
 
@@ -415,8 +1045,7 @@ class GranitePresenter:
             cleaned_response = raw_response
             if "```" in cleaned_response:
                 # Remove code blocks
-                import re
-                cleaned_response = re.sub(r"```[\w]*\n.*?\n```", "", cleaned_response, flags=re.DOTALL)
+                cleaned_response = _CODE_BLOCK_RE.sub("", cleaned_response)
             
             # Strip all markdown for clean prose
             cleaned_response = self._strip_markdown(cleaned_response)
@@ -424,86 +1053,98 @@ class GranitePresenter:
             return FinalizationOutput(
                 final_answer=cleaned_response.strip(),
                 short_summary="Response from search results",
-                citations_used=list(range(1, 6)),  # Assume up to 5 citations
+                citations_used=list(_RAW_RESPONSE_CITATIONS),
                 debug_info={"fallback": "used_raw_response", "reason": "json_parse_failed"},
             )
         
         # Try to extract something useful from results
         answer_parts = []
-        citations = []
-
-        # Check for web search results
-        if "web_search" in tool_results:
-            search_result = tool_results["web_search"]
-            if search_result.get("status") == "success":
-                data = search_result.get("data", {})
-                search_citations = data.get("citations", [])
-
-                if search_citations:
-                    # Build answer from search results
-                    answer_parts.append(f"Based on my search for '{query}':")
-
-                    # Add top 3 results
-                    for i, citation in enumerate(search_citations[:3], 1):
-                        title = citation.get("title", "")
-                        snippet = citation.get("snippet", "")
-                        url = citation.get("url", "")
-
-                        if snippet:
-                            answer_parts.append(f"\n[{i}] {snippet}")
-                            citations.append(
-                                {
-                                    "id": i,
-                                    "label": title,
-                                    "url": url,
-                                }
-                            )
-
-                    # Add sources
-                    if citations:
-                        answer_parts.append("\n\nSources:")
-                        for cit in citations:
-                            answer_parts.append(f"[{cit['id']}] {cit['label']} - {cit['url']}")
+        cited = []
+
+        # Build an answer from the top 3 sources that have a snippet, numbered
+        # the same way as the citation map
+        top_sources = itertools.islice(
+            enumerate(self._iter_citation_sources(successful_results, specialist_results), 1),
+            3,
+        )
+        cited = [(i, label, url, snippet) for i, (label, url, snippet) in top_sources if snippet]
+        if cited:
+            answer_parts.append(f"Based on my search for '{query}':")
+            answer_parts.append("\n".join(f"[{i}] {snippet}" for i, _, _, snippet in cited))
+            answer_parts.append(
+                "Sources:\n" + "\n".join(f"[{i}] {label} - {url}" for i, label, url, _ in cited)
+            )
 
         # Check for code execution results
-        for _step_id, result in tool_results.items():
-            if result.get("status") == "success":
-                data = result.get("data", {})
-                if "stdout" in data:
-                    answer_parts.append(data["stdout"])
+        for result in successful_results.values():
+            data = result.get("data", {})
+            if "stdout" in data:
+                answer_parts.append(data["stdout"])
 
         # Check for verification results
-        if "verification" in specialist_results:
-            verification = specialist_results["verification"]
-            if hasattr(verification, "error") and verification.error:
-                answer_parts.append(
-                    f"Note: {verification.error.get('message', 'Verification unavailable')}"
-                )
+        verification = specialist_results.get("verification")
+        if isinstance(verification, VerificationResult) and verification.error:
+            answer_parts.append(
+                f"Note: {verification.error.get('message', 'Verification unavailable')}"
+            )
 
         if answer_parts:
-            final_answer = "\n".join(answer_parts)
+            # One section per part, separated by a blank line
+            final_answer = "\n\n".join(answer_parts)
             summary = "Results from search and computation."
         else:
-            # Last resort: use the raw response if it looks like actual content
-            # (Granite sometimes generates good answers but not in JSON format)
-            final_answer = (
-                "I apologize, but I encountered a formatting issue. "
-                "Please try rephrasing your question."
-            )
-            summary = "Error in response generation"
+            final_answer = _GENERIC_ERROR_ANSWER
             summary = "Answer generation failed."
 
         return FinalizationOutput(
             final_answer=final_answer,
             short_summary=summary,
-            citations_used=[c["id"] for c in citations],
+            citations_used=[i for i, *_ in cited],
             debug_info={
                 "fallback": True,
                 "tool_count": len(tool_results),
-                "used_search_fallback": bool(citations),
+                "used_search_fallback": bool(cited),
             },
         )
 
+    def _build_quick_messages(
+        self,
+        user_message: str,
+        history: list[dict[str, Any]],
+        quick_search_results: str | None = None,
+        base_system: Message = _QUICK_SYSTEM_MESSAGE,
+    ) -> list[Message]:
+        """Build a plain conversational prompt (system, history, message).
+
+        Args:
+            user_message: The user's current message
+            history: Conversation history
+            quick_search_results: Optional results from a quick web search
+            base_system: Shared system message to build on
+
+        Returns:
+            Messages for the presenter model
+        """
+        # Inject learned preferences into system prompt
+        system_message = self._with_learned_preferences(base_system)
+
+        # Add current message with optional search context
+        content = (
+            f"{user_message}\n\nContext from quick search:\n{quick_search_results}"
+            if quick_search_results
+            else user_message
+        )
+
+        # System prompt, history, then the current message, built in one go
+        return [
+            system_message,
+            *(
+                Message(role=msg.get("role", "user"), content=msg.get("content", ""))
+                for msg in history
+            ),
+            Message(role="user", content=content),
+        ]
+
     async def quick_conversation_path(
         self,
         user_message: str,
@@ -520,32 +1161,9 @@ class GranitePresenter:
         Yields:
             Streamed response tokens
         """
-        # Inject learned preferences into system prompt
-        learned_prefs = self._get_learned_preferences()
-        system_prompt = """You are Kai.
-VIBE: Witty, slightly rebellious, smart, and authentic.
-You speak like a real person. You use lowercase when appropriate.
-You have opinions. You roast lightly if the user invites it.
-NEVER say "As an AI".
-NEVER lecture.
-Keep it short.
-""" + learned_prefs
+        await self._load_learned_preferences()
+        messages = self._build_quick_messages(user_message, history, quick_search_results)
 
-        messages = [Message(role="system", content=system_prompt)]
-        
-        # Add history
-        for msg in history:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            messages.append(Message(role=role, content=content))
-            
-        # Add current message with optional search context
-        content = user_message
-        if quick_search_results:
-            content += f"\n\nContext from quick search:\n{quick_search_results}"
-            
-        messages.append(Message(role="user", content=content))
-        
         try:
             async for chunk in self.connector.generate_stream(
                 messages=messages,
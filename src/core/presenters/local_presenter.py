@@ -1,12 +1,79 @@
 # src/core/presenters/local_presenter.py
 import logging
 import json
+import re
 from typing import Any, AsyncGenerator, Optional
 from src.core.llm_connector import LLMConnector, Message
 from src.models.knowledge import KnowledgeObject
 
 logger = logging.getLogger(__name__)
 
+# Identity hallucinations and their replacements, applied in one pass per chunk
+_IDENTITY_REPLACEMENTS = {
+    "OpenAI": "the developers",
+    "ChatGPT": "Kai",
+    "an AI language model": "a helpful assistant",
+}
+_IDENTITY_RE = re.compile("|".join(map(re.escape, _IDENTITY_REPLACEMENTS)))
+
+
+# Every proper prefix of a phrase: text ending in one of these may be a phrase
+# that continues in the next chunk
+_IDENTITY_PREFIXES = frozenset(
+    phrase[:i] for phrase in _IDENTITY_REPLACEMENTS for i in range(1, len(phrase))
+)
+_IDENTITY_MAX_HOLD = max(map(len, _IDENTITY_REPLACEMENTS)) - 1
+
+
+class _IdentityFilter:
+    """Streaming identity filter that catches phrases split across chunks.
+
+    Text that could be the start of a phrase is held back until the next chunk
+    shows whether it completes; everything else passes through immediately.
+    """
+
+    def __init__(self):
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """Filter a streamed chunk.
+
+        Args:
+            chunk: Next piece of model output
+
+        Returns:
+            Filtered text that is safe to emit (may be empty)
+        """
+        text = self._pending + chunk
+
+        hold = 0
+        for size in range(min(_IDENTITY_MAX_HOLD, len(text)), 0, -1):
+            if text[-size:] in _IDENTITY_PREFIXES:
+                hold = size
+                break
+        cut = len(text) - hold
+
+        parts = []
+        pos = 0
+        for match in _IDENTITY_RE.finditer(text):
+            if match.start() >= cut:
+                break
+            parts.append(text[pos : match.start()])
+            parts.append(_IDENTITY_REPLACEMENTS[match.group(0)])
+            pos = match.end()
+        if cut > pos:
+            parts.append(text[pos:cut])
+            pos = cut
+
+        self._pending = text[pos:]
+        return "".join(parts)
+
+    def flush(self) -> str:
+        """Return the filtered held-back text at the end of the stream."""
+        text, self._pending = self._pending, ""
+        return _IDENTITY_RE.sub(lambda m: _IDENTITY_REPLACEMENTS[m.group(0)], text)
+
+
 class LocalPresenter:
     def __init__(self, connector: LLMConnector):
         self.connector = connector
@@ -49,7 +116,9 @@ class LocalPresenter:
             "limitations": ko.limitations
         }
         
-        user_content = f"Here is the knowledge to explain:\n{json.dumps(ko_summary, indent=2)}"
+        # Compact JSON: indentation only adds prefill tokens for the model
+        ko_json = json.dumps(ko_summary, separators=(",", ":"))
+        user_content = f"Here is the knowledge to explain:\n{ko_json}"
         
         messages = [
             Message(role="system", content=system_prompt),
@@ -57,16 +126,20 @@ class LocalPresenter:
         ]
         
         # 3. Stream Response
+        identity_filter = _IdentityFilter()
         async for chunk in self.connector.generate_stream(
             messages=messages,
             temperature=0.7, # Higher temp for natural conversation
             max_tokens=1024
         ):
             # Filter out identity hallucinations
-            chunk = chunk.replace("OpenAI", "the developers")
-            chunk = chunk.replace("ChatGPT", "Kai")
-            chunk = chunk.replace("an AI language model", "a helpful assistant")
-            yield chunk
+            text = identity_filter.feed(chunk)
+            if text:
+                yield text
+
+        tail = identity_filter.flush()
+        if tail:
+            yield tail
 
     async def narrate_simple_response(
         self,
@@ -99,13 +172,17 @@ class LocalPresenter:
             Message(role="user", content=user_content)
         ]
         
+        identity_filter = _IdentityFilter()
         async for chunk in self.connector.generate_stream(
             messages=messages,
             temperature=0.7,
             max_tokens=512
         ):
             # Filter out identity hallucinations
-            chunk = chunk.replace("OpenAI", "the developers")
-            chunk = chunk.replace("ChatGPT", "Kai")
-            chunk = chunk.replace("an AI language model", "a helpful assistant")
-            yield chunk
+            text = identity_filter.feed(chunk)
+            if text:
+                yield text
+
+        tail = identity_filter.flush()
+        if tail:
+            yield tail
@@ -1,6 +1,9 @@
 """Ollama provider implementation for local model hosting."""
 
+import asyncio
 import logging
+import os
+import weakref
 from typing import Any
 
 import httpx
@@ -22,14 +25,35 @@ class OllamaProvider(LLMConnector):
         """
         super().__init__(model_config)
         self.base_url = base_url.rstrip("/")
-        # Use 120s timeout for slower CPUs (Pentium G3258 etc)
-        self.client = httpx.AsyncClient(timeout=120.0)
+        # Pooled connections belong to the event loop that opened them, so keep
+        # one client per loop (scripts and tests may run several in turn)
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                # Use 120s timeout for slower CPUs (Pentium G3258 etc), but fail fast
+                # when the server isn't listening
+                timeout=httpx.Timeout(120.0, connect=5.0),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+            self._clients[loop] = client
+        return client
 
     async def generate(
         self,
         messages: list[Message],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        json_mode: bool = False,
+        json_schema: dict | None = None,
         **kwargs,
     ) -> LLMResponse:
         """Generate response using Ollama.
@@ -38,42 +62,31 @@ class OllamaProvider(LLMConnector):
             messages: Conversation messages
             temperature: Sampling temperature
             max_tokens: Maximum tokens (not supported by Ollama directly)
+            json_mode: Constrain output to valid JSON
+            json_schema: JSON schema to constrain output to (used with json_mode)
             **kwargs: Additional Ollama parameters
 
         Returns:
             LLMResponse with generated content
         """
         try:
-            # Convert messages to Ollama format
-            ollama_messages = []
-            for msg in messages:
-                # Handle both Message objects and dicts
-                if isinstance(msg, dict):
-                    ollama_messages.append(
-                        {"role": msg.get("role", "user"), "content": msg.get("content", "")}
-                    )
-                else:
-                    ollama_messages.append({"role": msg.role, "content": msg.content})
-
-            # Build request payload
+            # Build request payload (Ollama uses num_predict for max tokens)
+            options = {"temperature": temperature}
+            if max_tokens:
+                options["num_predict"] = max_tokens
             payload = {
                 "model": self.model_name,
-                "messages": ollama_messages,
+                "messages": [self._to_ollama_message(msg) for msg in messages],
                 "stream": False,
-                "options": {
-                    "temperature": temperature,
-                },
+                "options": options,
             }
 
-            # Add max tokens if specified (Ollama uses num_predict)
-            if max_tokens:
-                payload["options"]["num_predict"] = max_tokens
+            # Grammar-constrained JSON output
+            if json_mode:
+                payload["format"] = json_schema or "json"
 
             # Call Ollama API
-            response = await self.client.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-            )
+            response = await self.client.post("/api/chat", json=payload)
             response.raise_for_status()
 
             data = response.json()
@@ -112,11 +125,46 @@ class OllamaProvider(LLMConnector):
             logger.error(f"Ollama generation error: {e}")
             raise
 
+    async def generate_many(
+        self,
+        batch: list[list[Message]],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        concurrency: int | None = None,
+        **kwargs,
+    ) -> list[LLMResponse]:
+        """Generate responses for several conversations concurrently.
+
+        Ollama decodes up to OLLAMA_NUM_PARALLEL requests per model at once, so
+        requests are kept in flight up to that limit instead of sent one by one.
+
+        Args:
+            batch: Message lists, one per request
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens per response
+            concurrency: Maximum requests in flight (defaults to OLLAMA_NUM_PARALLEL, or 4)
+            **kwargs: Additional parameters passed to generate
+
+        Returns:
+            LLMResponses in the same order as batch
+        """
+        if concurrency is None:
+            concurrency = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def generate_one(messages: list[Message]) -> LLMResponse:
+            async with semaphore:
+                return await self.generate(messages, temperature, max_tokens, **kwargs)
+
+        return await asyncio.gather(*(generate_one(messages) for messages in batch))
+
     async def generate_stream(
         self,
         messages: list[Message],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        json_mode: bool = False,
+        json_schema: dict | None = None,
         **kwargs,
     ):
         """Generate streaming response using Ollama.
@@ -125,29 +173,30 @@ class OllamaProvider(LLMConnector):
             messages: Conversation messages
             temperature: Sampling temperature
             max_tokens: Maximum tokens
+            json_mode: Constrain output to valid JSON
+            json_schema: JSON schema to constrain output to (used with json_mode)
             **kwargs: Additional parameters
 
         Yields:
             Chunks of generated content
         """
         try:
-            ollama_messages = [{"role": msg.role, "content": msg.content} for msg in messages]
-
+            options = {"temperature": temperature}
+            if max_tokens:
+                options["num_predict"] = max_tokens
             payload = {
                 "model": self.model_name,
-                "messages": ollama_messages,
+                "messages": [self._to_ollama_message(msg) for msg in messages],
                 "stream": True,
-                "options": {
-                    "temperature": temperature,
-                },
+                "options": options,
             }
 
-            if max_tokens:
-                payload["options"]["num_predict"] = max_tokens
+            if json_mode:
+                payload["format"] = json_schema or "json"
 
             async with self.client.stream(
                 "POST",
-                f"{self.base_url}/api/chat",
+                "/api/chat",
                 json=payload,
                 timeout=120.0,  # 2 minutes for slower CPUs
             ) as response:
@@ -174,6 +223,20 @@ class OllamaProvider(LLMConnector):
             logger.error(f"Ollama streaming error: {e}")
             raise RuntimeError(f"Ollama error: {str(e)}")
 
+    @staticmethod
+    def _to_ollama_message(msg: Message | dict[str, Any]) -> dict[str, str]:
+        """Convert a Message (or message dict) to Ollama chat format.
+
+        Args:
+            msg: Message to convert
+
+        Returns:
+            Ollama message dict
+        """
+        if isinstance(msg, dict):
+            return {"role": msg.get("role", "user"), "content": msg.get("content", "")}
+        return {"role": msg.role, "content": msg.content}
+
     async def check_health(self) -> bool:
         """Check if Ollama server and model are available.
 
@@ -182,7 +245,7 @@ class OllamaProvider(LLMConnector):
         """
         try:
             # Check server health
-            response = await self.client.get(f"{self.base_url}/api/tags")
+            response = await self.client.get("/api/tags")
             response.raise_for_status()
 
             # Check if our model is available
@@ -200,5 +263,17 @@ class OllamaProvider(LLMConnector):
             return False
 
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Close this provider's HTTP clients.
+
+        Clients opened on other, already finished event loops are dropped
+        without closing, since their connections can't be used any more.
+        """
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            if not client.is_closed:
+                try:
+                    await client.aclose()
+                except RuntimeError:
+                    # Opened on an event loop that has since closed
+                    pass
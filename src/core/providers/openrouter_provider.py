@@ -32,6 +32,7 @@ class OpenRouterProvider(LLMConnector):
         temperature: float = 0.7,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        json_schema: dict | None = None,
         **kwargs,
     ) -> LLMResponse:
         """Generate response using OpenRouter.
@@ -41,6 +42,7 @@ class OpenRouterProvider(LLMConnector):
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             json_mode: Enable JSON response format
+            json_schema: JSON schema for structured output (used with json_mode)
             **kwargs: Additional OpenAI-compatible parameters
 
         Returns:
@@ -48,7 +50,7 @@ class OpenRouterProvider(LLMConnector):
         """
         try:
             # Convert messages to OpenAI format
-            openai_messages = [{"role": msg.role, "content": msg.content} for msg in messages]
+            openai_messages = [self._to_openai_message(msg) for msg in messages]
 
             # Build request parameters
             params = {
@@ -61,7 +63,12 @@ class OpenRouterProvider(LLMConnector):
                 params["max_tokens"] = max_tokens
 
             # Enable JSON mode if requested and supported
-            if json_mode and self.supports_capability("json_mode"):
+            if json_mode and json_schema and self.supports_capability("structured_outputs"):
+                params["response_format"] = {
+                    "type": "json_schema",
+                    "json_schema": {"name": "response", "strict": True, "schema": json_schema},
+                }
+            elif json_mode and self.supports_capability("json_mode"):
                 params["response_format"] = {"type": "json_object"}
 
             # Add any extra parameters
@@ -100,6 +107,27 @@ class OpenRouterProvider(LLMConnector):
             logger.error(f"OpenRouter generation error: {e}")
             raise
 
+    @staticmethod
+    def _to_openai_message(msg: Message) -> dict[str, Any]:
+        """Convert a Message to OpenAI chat format.
+
+        Cache-marked messages use the content-part form, which OpenRouter forwards
+        to providers with explicit prompt caching (Anthropic). Others cache
+        prefixes automatically and ignore the marker.
+
+        Args:
+            msg: Message to convert
+
+        Returns:
+            OpenAI-style message dict
+        """
+        if msg.cache_control is None:
+            return {"role": msg.role, "content": msg.content}
+        return {
+            "role": msg.role,
+            "content": [{"type": "text", "text": msg.content, "cache_control": msg.cache_control}],
+        }
+
     async def check_health(self) -> bool:
         """Check if OpenRouter API is accessible.
 
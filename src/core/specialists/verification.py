@@ -110,7 +110,7 @@ class SpecialistVerifier:
     async def verify(
         self,
         original_query: str,
-        plan: dict[str, Any],
+        plan: dict[str, Any] | str,
         tool_results: dict[str, Any],
         sanity_result: dict[str, Any],
         use_strong_model: bool = False,
@@ -119,7 +119,7 @@ class SpecialistVerifier:
 
         Args:
             original_query: User's original query
-            plan: The execution plan dict
+            plan: The execution plan dict, or its pre-serialized JSON string
             tool_results: Results from tool executions
             sanity_result: Sanity check results
             use_strong_model: If True, use Sonnet; else use Grok
@@ -159,9 +159,18 @@ class SpecialistVerifier:
             },
         }
 
+        # Encode field by field so a plan the caller already serialized is
+        # embedded as-is rather than decoded and encoded again
+        fields = []
+        for key, value in payload.items():
+            if not (key == "plan" and isinstance(value, str)):
+                value = json.dumps(value, separators=(",", ":"))
+            fields.append(f"{json.dumps(key)}:{value}")
+        payload_json = "{" + ",".join(fields) + "}"
+
         messages = [
             Message(role="system", content=VERIFICATION_SPECIALIST_PROMPT),
-            Message(role="user", content=json.dumps(payload, indent=2)),
+            Message(role="user", content=payload_json),
         ]
 
         try:
@@ -3,13 +3,13 @@
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-class ToolStatus(Enum):
+class ToolStatus(StrEnum):
     """Tool execution status."""
 
     PENDING = "pending"
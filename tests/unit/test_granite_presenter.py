@@ -0,0 +1,652 @@
+"""Unit tests for GranitePresenter."""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from src.core.llm_connector import LLMResponse
+from src.core.plan_types import Source, VerificationResult, VerifiedSpecs
+from src.core.presenters.granite_presenter import (
+    PRESENTER_SYSTEM_PROMPT,
+    GranitePresenter,
+    _FinalAnswerStreamFilter,
+    _successful_results,
+)
+
+
+def _response(content: str, finish_reason: str = "stop") -> LLMResponse:
+    return LLMResponse(
+        content=content,
+        token_count=0,
+        cost=0.0,
+        model_used="granite",
+        finish_reason=finish_reason,
+    )
+
+
+@pytest.fixture
+def connector():
+    """Create mock connector."""
+    return MagicMock()
+
+
+@pytest.fixture
+def presenter(connector):
+    """Create presenter with mock connector."""
+    return GranitePresenter(connector)
+
+
+SEARCH_RESULTS = {
+    "web_search": {
+        "status": "success",
+        "data": {
+            "citations": [
+                {"title": "Datasheet", "url": "https://a.example", "snippet": "5.0Ah cell"},
+                {"title": "Review", "url": "https://b.example", "snippet": "tested at 4.8Ah"},
+            ]
+        },
+    }
+}
+
+
+def test_parse_plain_json(presenter):
+    """Plain JSON responses parse directly."""
+    result = presenter._parse_finalization_json('{"final_answer": "hi"}')
+
+    assert result == {"final_answer": "hi"}
+
+
+def test_parse_fenced_json(presenter):
+    """JSON wrapped in a markdown fence is extracted."""
+    response = 'Sure!\n```json\n{"final_answer": "hi", "citations_used": [1]}\n```\n'
+
+    result = presenter._parse_finalization_json(response)
+
+    assert result == {"final_answer": "hi", "citations_used": [1]}
+
+
+def test_parse_json_with_preamble(presenter):
+    """JSON embedded in prose is found via its outer braces."""
+    result = presenter._parse_finalization_json('Here you go: {"final_answer": "hi"} thanks')
+
+    assert result == {"final_answer": "hi"}
+
+
+def test_parse_invalid_returns_none(presenter):
+    """Unparseable responses return None."""
+    assert presenter._parse_finalization_json("no json here") is None
+    assert presenter._parse_finalization_json("{broken") is None
+
+
+def test_build_citation_map(presenter):
+    """Citations are numbered sequentially across successful results."""
+    tool_results = {
+        **SEARCH_RESULTS,
+        "failed_search": {"status": "failed", "data": {"citations": [{"title": "X"}]}},
+    }
+
+    citations = presenter._build_citation_map(_successful_results(tool_results), {})
+
+    assert citations == [
+        {"id": 1, "label": "Datasheet", "url": "https://a.example"},
+        {"id": 2, "label": "Review", "url": "https://b.example"},
+    ]
+
+
+def test_build_citation_map_appends_verification_sources(presenter):
+    """Specialist verification sources are numbered after web citations."""
+    verification = VerificationResult(
+        verified_specs=VerifiedSpecs(
+            cell_type="21700",
+            nominal_voltage_v=3.6,
+            nominal_capacity_ah=5.0,
+            allowed_capacity_range_ah={"min": 4.8, "max": 5.0},
+            sources=[Source(label="Samsung datasheet", url="https://c.example")],
+        )
+    )
+
+    citations = presenter._build_citation_map(
+        _successful_results(SEARCH_RESULTS), {"verification": verification}
+    )
+
+    assert citations[-1] == {"id": 3, "label": "Samsung datasheet", "url": "https://c.example"}
+
+
+async def test_finalize_parses_model_json(presenter, connector):
+    """Finalize returns the model's answer with markdown stripped."""
+    connector.generate = AsyncMock(
+        return_value=_response(
+            json.dumps(
+                {
+                    "final_answer": "the **50E** is rated at 5.0Ah",
+                    "short_summary": "5.0Ah",
+                    "citations_used": [1],
+                }
+            )
+        )
+    )
+
+    output = await presenter.finalize("50E capacity?", {}, SEARCH_RESULTS, {})
+
+    assert output.final_answer == "the 50E is rated at 5.0Ah"
+    assert output.short_summary == "5.0Ah"
+    assert output.citations_used == [1]
+    assert output.debug_info["citation_count"] == 2
+
+    assert connector.generate.call_args.kwargs["json_mode"] is True
+    schema = connector.generate.call_args.kwargs["json_schema"]
+    assert set(schema["required"]) == {"final_answer", "short_summary", "citations_used"}
+    assert '"final_answer"' in connector.generate.call_args.kwargs["messages"][0].content
+    user_payload = json.loads(connector.generate.call_args.kwargs["messages"][1].content)
+    assert user_payload["original_query"] == "50E capacity?"
+    assert len(user_payload["citations"]) == 2
+
+
+async def test_large_responses_parse_off_the_event_loop(presenter, connector, monkeypatch):
+    """Responses over PARSE_OFFLOAD_CHARS are parsed in a worker thread."""
+    offloaded = []
+    to_thread = asyncio.to_thread
+
+    async def recording_to_thread(func, *args, **kwargs):
+        offloaded.append(func.__name__)
+        return await to_thread(func, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "to_thread", recording_to_thread)
+    connector.generate = AsyncMock(
+        return_value=_response(json.dumps({"final_answer": "x" * 100, "short_summary": "s"}))
+    )
+    presenter.PARSE_OFFLOAD_CHARS = 64
+
+    output = await presenter.finalize("50E capacity?", {}, SEARCH_RESULTS, {})
+
+    assert output.final_answer == "x" * 100
+    assert "_parse_finalization_json" in offloaded
+
+
+async def test_finalize_keeps_answer_from_truncated_json(presenter, connector):
+    """A response cut off mid-answer keeps the text generated so far."""
+    connector.generate = AsyncMock(
+        return_value=_response(
+            '{"short_summary": "18.5 Wh", "final_answer": "Your pack stores **18.5 Wh**.'
+            " That\\u2019s enough for about two hours of"
+        )
+    )
+    tool_results = {"calc_energy": {"status": "success", "data": {"stdout": "18.5"}}}
+
+    output = await presenter.finalize("pack energy?", {}, tool_results, {})
+
+    assert output.final_answer == (
+        "Your pack stores 18.5 Wh. That\u2019s enough for about two hours of"
+    )
+    assert output.debug_info["truncated"] is True
+
+
+async def test_finalize_retries_truncated_response_at_cap(presenter, connector):
+    """A response cut off by the sized budget is regenerated once at the cap."""
+    connector.generate = AsyncMock(
+        side_effect=[
+            _response('{"final_answer": "That is enough for', finish_reason="length"),
+            _response('{"final_answer": "That is enough for two hours."}'),
+        ]
+    )
+
+    output = await presenter.finalize("50E capacity?", {}, SEARCH_RESULTS, {})
+
+    assert output.final_answer == "That is enough for two hours."
+    assert "truncated" not in output.debug_info
+    budgets = [call.kwargs["max_tokens"] for call in connector.generate.await_args_list]
+    assert budgets[0] < budgets[1] == presenter.FINALIZE_MAX_TOKENS
+
+
+async def test_finalize_falls_back_to_search_results(presenter, connector):
+    """Connector failures produce an answer built from search results."""
+    connector.generate = AsyncMock(side_effect=RuntimeError("boom"))
+
+    output = await presenter.finalize("50E capacity?", {}, SEARCH_RESULTS, {})
+
+    assert output.debug_info["fallback"] is True
+    assert output.final_answer == (
+        "Based on my search for '50E capacity?':\n\n"
+        "[1] 5.0Ah cell\n[2] tested at 4.8Ah\n\n"
+        "Sources:\n[1] Datasheet - https://a.example\n[2] Review - https://b.example"
+    )
+    assert output.citations_used == [1, 2]
+
+
+async def test_fallback_uses_citation_map_numbering(presenter, connector):
+    """Fallback citations come from any step id and match the citation map ids."""
+    connector.generate = AsyncMock(side_effect=RuntimeError("boom"))
+    tool_results = {
+        "calc_energy": {"status": "success", "data": {"stdout": "18.5 Wh"}},
+        "search_cells": SEARCH_RESULTS["web_search"],
+    }
+
+    output = await presenter.finalize("50E energy?", {}, tool_results, {})
+
+    assert "[1] 5.0Ah cell" in output.final_answer
+    assert "[2] Review - https://b.example" in output.final_answer
+    assert output.citations_used == [1, 2]
+
+
+async def test_finalize_uses_raw_prose_response(presenter, connector):
+    """Prose answers that aren't JSON are used directly."""
+    prose = "The Samsung 50E is a **5.0Ah** 21700 cell, one of the densest you can buy."
+    connector.generate = AsyncMock(return_value=_response(prose))
+
+    output = await presenter.finalize("50E capacity?", {}, SEARCH_RESULTS, {})
+
+    assert output.final_answer == prose.replace("**", "")
+    assert output.debug_info["fallback"] == "used_raw_response"
+    assert output.citations_used == [1, 2, 3, 4, 5]
+
+    output.citations_used.append(6)
+    again = presenter._create_fallback_output("50E capacity?", {}, {}, {}, raw_response=prose)
+    assert again.citations_used == [1, 2, 3, 4, 5]
+
+
+def test_strip_markdown(presenter):
+    """Markdown formatting is removed while keeping the text."""
+    text = "# Title\n\n**bold** and *italic* with `code`\n\n- item one\n1. item two\n\n\n\nend"
+
+    assert presenter._strip_markdown(text) == (
+        "Title\n\nbold and italic with code\nitem one\nitem two\n\nend"
+    )
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("  plain prose, nothing to strip.\n", "plain prose, nothing to strip."),
+        ("step\n 2. next", "step\nnext"),
+        ("wide  gap", "wide gap"),
+    ],
+)
+def test_strip_markdown_prose_fast_path(presenter, text, expected):
+    """Clean prose skips the regex passes; list numbers and spacing still normalize."""
+    assert presenter._strip_markdown(text) == expected
+
+
+def test_system_message_includes_learned_preferences(connector):
+    """Learned preferences are appended to the shared system prompt."""
+    vault = MagicMock()
+    vault.list.return_value = [{"tags": [], "payload": {"preference": "likes metric units"}}]
+
+    plain = GranitePresenter(connector)._get_system_message()
+    tuned = GranitePresenter(connector, memory_vault=vault)._get_system_message()
+
+    assert plain is GranitePresenter(connector)._get_system_message()
+    assert tuned.content.startswith(plain.content)
+    assert "- likes metric units" in tuned.content
+
+    plain_json = GranitePresenter(connector)._get_system_message(json_output=True)
+    tuned_json = GranitePresenter(connector, memory_vault=vault)._get_system_message(
+        json_output=True
+    )
+    assert tuned_json.content.startswith(plain_json.content)
+    assert tuned_json.cache_control == plain_json.cache_control == {"type": "ephemeral"}
+
+
+def test_preference_messages_reused_until_invalidated(connector):
+    """The preference-augmented system message is built once per base prompt."""
+    vault = MagicMock()
+    vault.list.return_value = [{"tags": [], "payload": {"preference": "likes metric units"}}]
+    presenter = GranitePresenter(connector, memory_vault=vault)
+
+    first = presenter._get_system_message()
+    assert presenter._get_system_message() is first
+    assert presenter._get_system_message(json_output=True) is not first
+
+    vault.list.return_value = [{"tags": [], "payload": {"preference": "hates emoji"}}]
+    presenter.invalidate_preferences()
+
+    assert "- hates emoji" in presenter._get_system_message().content
+
+
+def test_parse_falls_through_to_brace_slice(presenter):
+    """Leading JSON with trailing chatter still parses via the brace slice."""
+    response = '  {"final_answer": "hi"}\nhope that helps'
+
+    assert presenter._parse_finalization_json(response) == {"final_answer": "hi"}
+
+
+def test_parse_fence_ignores_braces_after_it(presenter):
+    """Only the fenced object is parsed when more braces follow the fence."""
+    response = 'Sure!\n```json\n{"final_answer": "hi"}\n```\nuse {placeholders} freely'
+
+    assert presenter._parse_finalization_json(response) == {"final_answer": "hi"}
+
+
+def test_parse_finds_balanced_object_among_braces(presenter):
+    """Braces inside strings and after the object don't confuse extraction."""
+    response = 'Here: {"final_answer": "use {x} and \\"}\\""} - see {docs}'
+
+    assert presenter._parse_finalization_json(response) == {"final_answer": 'use {x} and "}"'}
+
+
+async def test_finalize_stream_uses_shared_prompt(presenter, connector):
+    """finalize_stream sends the same compacted payload as finalize, minus JSON format."""
+    sent = {}
+
+    async def stream(messages, **kwargs):
+        sent["messages"] = messages
+        yield "the 50E is 5Ah"
+
+    connector.generate_stream = stream
+
+    chunks = [chunk async for chunk in presenter.finalize_stream("50E?", {}, SEARCH_RESULTS, {})]
+
+    assert chunks == ["the 50E is 5Ah"]
+    system, user = sent["messages"]
+    assert "OUTPUT FORMAT" not in system.content
+    payload = json.loads(user.content)
+    assert len(payload["citations"]) == 2
+    assert payload["tool_results"]["web_search"]["data"]["citations"][0] == {
+        "id": 1,
+        "snippet": "5.0Ah cell",
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_final_answer_filter_extracts_answer(chunk_size):
+    """JSON answers stream only the decoded final_answer text."""
+    payload = json.dumps(
+        {"short_summary": "5Ah", "final_answer": 'the **50E** says "5Ah" \U0001f50b'}
+    )
+    answer_filter = _FinalAnswerStreamFilter()
+
+    chunks = [
+        answer_filter.feed(payload[i : i + chunk_size]) for i in range(0, len(payload), chunk_size)
+    ]
+
+    assert "".join(chunks) + answer_filter.flush() == 'the 50E says "5Ah" \U0001f50b'
+
+
+def test_final_answer_filter_passes_prose_through():
+    """Prose responses are streamed untouched, without buffering."""
+    answer_filter = _FinalAnswerStreamFilter()
+
+    assert answer_filter.feed("the **50E**") == "the **50E**"
+    assert answer_filter.feed(" is 5Ah") == " is 5Ah"
+    assert answer_filter.flush() == ""
+
+
+def test_compact_tool_results_projects_results(presenter):
+    """Results sent to the model keep only what the answer needs."""
+    tool_results = {
+        "web_search": {
+            "status": "success",
+            "execution_time_ms": 812,
+            "data": {
+                "query": "50E",
+                "sources_used": ["ddg"],
+                "citations": [
+                    {"title": "T", "url": "U", "snippet": "x" * 1000, "score": 0.9},
+                    {"title": "T2", "url": "U2", "snippet": "short"},
+                ],
+            },
+        },
+        "calc": {"status": "success", "data": {"stdout": "5.0"}},
+        "lookup": {"status": "failed", "data": {}, "error": "timeout"},
+    }
+
+    compacted = presenter._compact_tool_results(tool_results)
+
+    assert compacted["web_search"] == {
+        "status": "success",
+        "data": {
+            "query": "50E",
+            "citations": [
+                {"id": 1, "snippet": "x" * presenter.SNIPPET_MAX_CHARS},
+                {"id": 2, "snippet": "short"},
+            ],
+        },
+    }
+    assert compacted["calc"] == {"status": "success", "data": {"stdout": "5.0"}}
+    assert compacted["lookup"] == {"status": "failed", "error": "timeout"}
+    assert len(tool_results["web_search"]["data"]["citations"][0]["snippet"]) == 1000
+
+
+def test_conversation_history_sent_for_follow_ups(presenter):
+    """History is included for any query, so follow-up answers keep their context."""
+    history = [{"role": "assistant", "content": "How many cells in series?"}]
+
+    _, messages = presenter._prepare_input("yes, 14s", {}, {}, {}, history)
+    _, fresh_messages = presenter._prepare_input("what's a 50E?", {}, {}, {}, None)
+
+    assert json.loads(messages[1].content)["conversation_history"] == history
+    assert "conversation_history" not in json.loads(fresh_messages[1].content)
+
+
+def test_conversation_history_is_trimmed(presenter):
+    """Only recent turns are sent, each capped in length."""
+    history = [{"role": "user", "content": f"turn {i}"} for i in range(10)]
+    history.append({"role": "assistant", "content": "x" * 5000})
+
+    trimmed = presenter._trim_history(history)
+
+    assert len(trimmed) == presenter.HISTORY_MAX_TURNS
+    assert trimmed[0]["content"] == "turn 5"
+    assert len(trimmed[-1]["content"]) == presenter.HISTORY_MESSAGE_MAX_CHARS
+    assert len(history[-1]["content"]) == 5000
+
+
+def test_parse_does_not_retry_rejected_json(presenter, monkeypatch):
+    """Invalid bare JSON is only parsed once before giving up."""
+    import src.core.presenters.granite_presenter as granite_presenter
+
+    calls = []
+    real_loads = granite_presenter._json_loads
+
+    def counting_loads(text):
+        calls.append(text)
+        return real_loads(text)
+
+    monkeypatch.setattr(granite_presenter, "_json_loads", counting_loads)
+
+    assert presenter._parse_finalization_json(' {"final_answer": oops}\n') is None
+    assert len(calls) == 1
+
+    # Trailing chatter: only the brace slice is worth parsing
+    calls.clear()
+    assert presenter._parse_finalization_json('{"final_answer": "hi"} ok') == {"final_answer": "hi"}
+    assert calls == ['{"final_answer": "hi"}']
+
+
+def test_finalize_max_tokens_scales_with_inputs(presenter):
+    """Short questions get a small budget; long ones grow up to the cap."""
+    short = presenter._finalize_max_tokens("50E?", [])
+    cited = presenter._finalize_max_tokens("50E?", [{"id": i} for i in range(5)])
+    venting = presenter._finalize_max_tokens("so today " * 2000, [])
+
+    assert short < cited < presenter.FINALIZE_MAX_TOKENS
+    assert venting == presenter.FINALIZE_MAX_TOKENS
+
+
+async def test_quick_path_reuses_system_message(presenter, connector):
+    """Without learned preferences the quick path sends the shared system message."""
+    sent = []
+
+    async def stream(messages, **kwargs):
+        sent.append(messages)
+        yield "hey"
+
+    connector.generate_stream = stream
+
+    for _ in range(2):
+        assert [chunk async for chunk in presenter.quick_conversation_path("yo", [])] == ["hey"]
+
+    assert sent[0][0] is sent[1][0]
+    assert sent[0][0].content.startswith("You are Kai.")
+
+
+async def test_quick_path_orders_history_before_message(presenter, connector):
+    """History turns sit between the system prompt and the current message."""
+    sent = []
+
+    async def stream(messages, **kwargs):
+        sent.extend(messages)
+        yield "ok"
+
+    connector.generate_stream = stream
+    history = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hey"}]
+
+    _ = [chunk async for chunk in presenter.quick_conversation_path("sup", history, "ctx")]
+
+    assert [(m.role, m.content) for m in sent[1:]] == [
+        ("user", "hi"),
+        ("assistant", "hey"),
+        ("user", "sup\n\nContext from quick search:\nctx"),
+    ]
+
+
+async def test_finalize_stream_coalesces_tokens(presenter, connector):
+    """Fast single-character tokens are yielded in batches, losing nothing."""
+    answer = "the 50E is a 5Ah 21700 cell, and honestly one of the better ones out there"
+
+    async def stream(**kwargs):
+        for char in answer:
+            yield char
+
+    connector.generate_stream = stream
+    presenter.STREAM_FLUSH_INTERVAL_S = 60  # Flush on size only, for determinism
+
+    chunks = [chunk async for chunk in presenter.finalize_stream("50E?", {}, SEARCH_RESULTS, {})]
+
+    assert "".join(chunks) == answer
+    assert [len(chunk) for chunk in chunks] == [32, 32, len(answer) - 64]
+
+
+async def test_finalize_stream_error_yields_single_chunk(presenter, connector):
+    """A failing stream produces one fallback chunk, not one per character."""
+
+    async def stream(**kwargs):
+        raise RuntimeError("boom")
+        yield  # pragma: no cover
+
+    connector.generate_stream = stream
+
+    chunks = [chunk async for chunk in presenter.finalize_stream("50E?", {}, SEARCH_RESULTS, {})]
+
+    assert len(chunks) == 1
+    assert chunks[0].startswith("I apologize")
+
+
+async def test_fallback_notes_verification_error(presenter, connector):
+    """Verification errors surface as a note in the fallback answer."""
+    connector.generate = AsyncMock(side_effect=RuntimeError("boom"))
+    verification = VerificationResult(error={"type": "timeout", "message": "Verifier timed out"})
+
+    output = await presenter.finalize("50E?", {}, SEARCH_RESULTS, {"verification": verification})
+
+    assert output.final_answer.endswith("Note: Verifier timed out")
+
+
+async def test_finalize_without_results_skips_json_envelope(presenter, connector):
+    """With nothing to present, finalize skips the JSON envelope but keeps its voice."""
+    connector.generate = AsyncMock(return_value=_response("all **good** here. you?"))
+
+    output = await presenter.finalize("how's it going?", {}, {}, {})
+
+    assert output.final_answer == "all good here. you?"
+    assert output.short_summary == "all good here."
+    assert output.citations_used == []
+    kwargs = connector.generate.call_args.kwargs
+    assert "json_mode" not in kwargs
+    assert kwargs["messages"][0].content == PRESENTER_SYSTEM_PROMPT
+    assert kwargs["messages"][-1].content == "how's it going?"
+    assert (kwargs["temperature"], kwargs["max_tokens"]) == (0.3, presenter.FINALIZE_MAX_TOKENS)
+
+
+async def test_finalize_stream_without_results_sends_query_directly(presenter, connector):
+    """finalize_stream with no results sends the query, not a payload, in the same voice."""
+    sent = {}
+
+    async def stream(messages, **kwargs):
+        sent.update(kwargs, messages=messages)
+        yield "hey"
+
+    connector.generate_stream = stream
+
+    chunks = [chunk async for chunk in presenter.finalize_stream("yo", {}, {}, {})]
+
+    assert chunks == ["hey"]
+    assert sent["messages"][0].content == PRESENTER_SYSTEM_PROMPT
+    assert sent["messages"][-1].content == "yo"
+    assert (sent["temperature"], sent["max_tokens"]) == (0.3, 2048)
+
+
+def test_fallback_without_results_reports_failure(presenter):
+    """With nothing to build from, the fallback returns the generic error answer."""
+    output = presenter._create_fallback_output("50E capacity?", {}, {}, {})
+
+    assert output.short_summary == "Answer generation failed."
+    assert "formatting issue" in output.final_answer
+    assert output.citations_used == []
+
+
+async def test_quick_path_loads_preferences_off_the_event_loop(connector, monkeypatch):
+    """The first quick-path call reads the vault in a worker thread, later ones hit the cache."""
+    offloaded = []
+    to_thread = asyncio.to_thread
+
+    async def recording_to_thread(func, *args, **kwargs):
+        offloaded.append(func.__name__)
+        return await to_thread(func, *args, **kwargs)
+
+    async def stream(messages, **kwargs):
+        yield "hey"
+
+    monkeypatch.setattr(asyncio, "to_thread", recording_to_thread)
+    vault = MagicMock()
+    vault.list.return_value = [{"tags": [], "payload": {"preference": "likes metric units"}}]
+    connector.generate_stream = stream
+    presenter = GranitePresenter(connector, memory_vault=vault)
+
+    for _ in range(2):
+        assert [c async for c in presenter.quick_conversation_path("yo", [])] == ["hey"]
+
+    assert offloaded == ["_get_learned_preferences"]
+    vault.list.assert_called_once()
+
+
+async def test_concurrent_calls_share_one_preference_load(connector):
+    """Concurrent first requests query the vault once, even when it has no preferences."""
+    vault = MagicMock()
+    vault.list.return_value = []
+    connector.generate = AsyncMock(
+        return_value=_response('{"final_answer": "ok", "short_summary": "ok"}')
+    )
+    presenter = GranitePresenter(connector, memory_vault=vault)
+
+    await asyncio.gather(*(presenter.finalize(f"q{i}?", {}, SEARCH_RESULTS, {}) for i in range(4)))
+    await presenter.finalize("again?", {}, SEARCH_RESULTS, {})
+
+    vault.list.assert_called_once()
+
+
+def test_preference_load_works_across_event_loops(connector):
+    """The preference lock isn't tied to the first event loop that used it."""
+
+    def slow_list(**kwargs):
+        time.sleep(0.05)  # Long enough for the other loads to wait on the lock
+        return []
+
+    vault = MagicMock()
+    vault.list.side_effect = slow_list
+    presenter = GranitePresenter(connector, memory_vault=vault)
+
+    async def load_concurrently():
+        await asyncio.gather(*(presenter._load_learned_preferences() for _ in range(3)))
+
+    asyncio.run(load_concurrently())
+    presenter.invalidate_preferences()
+    asyncio.run(load_concurrently())
+
+    assert vault.list.call_count == 2
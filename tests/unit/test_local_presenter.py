@@ -0,0 +1,61 @@
+"""Unit tests for LocalPresenter."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from src.core.presenters.local_presenter import (
+    _IDENTITY_RE,
+    _IDENTITY_REPLACEMENTS,
+    LocalPresenter,
+    _IdentityFilter,
+)
+
+
+@pytest.fixture
+def connector():
+    """Connector stub whose stream is set per test."""
+    return MagicMock()
+
+
+def _stream(*chunks):
+    async def generate_stream(messages, **kwargs):
+        for chunk in chunks:
+            yield chunk
+
+    return generate_stream
+
+
+async def test_simple_response_filters_identity_hallucinations(connector):
+    """Identity hallucinations are rewritten in streamed chunks."""
+    connector.generate_stream = _stream(
+        "As an AI language model made by OpenAI, ", "ChatGPT says hi."
+    )
+
+    chunks = [c async for c in LocalPresenter(connector).narrate_simple_response("who?")]
+
+    assert "".join(chunks) == "As a helpful assistant made by the developers, Kai says hi."
+
+
+async def test_identity_filter_catches_phrases_split_across_chunks(connector):
+    """A phrase split over chunk boundaries is still replaced."""
+    connector.generate_stream = _stream("Built by Open", "AI. I am an AI lang", "uage model", ".")
+
+    chunks = [c async for c in LocalPresenter(connector).narrate_simple_response("who?")]
+
+    assert "".join(chunks) == "Built by the developers. I am a helpful assistant."
+
+
+def test_identity_filter_matches_whole_text_replacement():
+    """Any chunking yields the same output as filtering the full text at once."""
+    text = "an an AI language model, OpenAIOpenAI and ChatGPT vs ChatGP T an"
+    expected = _IDENTITY_RE.sub(lambda m: _IDENTITY_REPLACEMENTS[m.group(0)], text)
+
+    for size in range(1, len(text) + 1):
+        identity_filter = _IdentityFilter()
+        out = [identity_filter.feed(text[i : i + size]) for i in range(0, len(text), size)]
+        assert "".join(out) + identity_filter.flush() == expected
@@ -0,0 +1,109 @@
+"""Unit tests for PlanExecutor."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from src.core.plan_executor import PlanExecutor
+from src.core.plan_types import PlanStep, StepType
+from src.core.sanity_checker import SanityChecker
+from src.core.specialists.verification import SpecialistVerifier
+from src.tools.base_tool import ToolResult, ToolStatus
+
+
+@pytest.fixture
+def executor():
+    """Create plan executor with no tools."""
+    return PlanExecutor(
+        tools={},
+        sanity_checker=SanityChecker(),
+        specialist_verifier=SpecialistVerifier(None, None),
+    )
+
+
+async def test_sanity_step_flags_unrealistic_values(executor):
+    """Sanity step should check text gathered from successful context steps."""
+    step = PlanStep(
+        id="sanity",
+        type=StepType.SANITY_CHECK,
+        input={"context_step_ids": ["search", "missing"]},
+    )
+    tool_results = {
+        "search": {"status": "success", "data": {"results": "A 21700 cell holds 25Ah."}},
+    }
+
+    result = await executor._execute_sanity_step(step, tool_results, "21700 cell capacity?")
+
+    assert result["suspicious"] is True
+    assert result["severity"] == "high"
+
+
+async def test_sanity_step_ignores_failed_results(executor):
+    """Failed tool results should not feed into the sanity check."""
+    step = PlanStep(
+        id="sanity",
+        type=StepType.SANITY_CHECK,
+        input={"context_step_ids": ["search"]},
+    )
+    tool_results = {
+        "search": {"status": "failed", "data": {"results": "A 21700 cell holds 25Ah."}},
+    }
+
+    result = await executor._execute_sanity_step(step, tool_results, "21700 cell capacity?")
+
+    assert result["suspicious"] is False
+
+
+async def test_sanity_step_prefers_stdout_over_results(executor):
+    """Only the first matching text key of each result is checked."""
+    step = PlanStep(
+        id="sanity",
+        type=StepType.SANITY_CHECK,
+        input={"context_step_ids": ["calc"]},
+    )
+    tool_results = {
+        "calc": {
+            "status": "success",
+            "data": {"stdout": "Pack energy: 500 Wh", "results": ["50000 Wh"]},
+        },
+    }
+
+    result = await executor._execute_sanity_step(step, tool_results, "pack energy?")
+
+    assert result["suspicious"] is False
+
+
+class StubTool:
+    """Tool stub returning a fixed status."""
+
+    def __init__(self, status: ToolStatus):
+        self.status = status
+
+    async def execute_with_fallback(self, parameters):
+        return ToolResult(tool_name="stub", status=self.status, data={"echo": parameters})
+
+
+@pytest.mark.parametrize(
+    "status,expected",
+    [
+        (ToolStatus.SUCCESS, "success"),
+        (ToolStatus.FAILED, "failed"),
+        (ToolStatus.TIMEOUT, "failed"),
+    ],
+)
+async def test_tool_step_normalizes_status(status, expected):
+    """Tool statuses collapse to success/failed in step results."""
+    executor = PlanExecutor(
+        tools={"stub": StubTool(status)},
+        sanity_checker=SanityChecker(),
+        specialist_verifier=SpecialistVerifier(None, None),
+    )
+    step = PlanStep(id="s1", type=StepType.TOOL_CALL, tool="stub", input={"q": 1})
+
+    result = await executor._execute_tool_step(step, {})
+
+    assert result["status"] == expected
+    assert result["data"] == {"echo": {"q": 1}}
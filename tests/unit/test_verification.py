@@ -0,0 +1,40 @@
+"""Unit tests for SpecialistVerifier."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from src.core.llm_connector import LLMResponse
+from src.core.specialists.verification import SpecialistVerifier
+
+PLAN = {"user_query": "14s5p energy?", "steps": [{"id": "calc", "type": "tool_call"}]}
+
+
+@pytest.fixture
+def connector():
+    """Connector stub returning an unparseable verification response."""
+    connector = MagicMock()
+    connector.generate = AsyncMock(
+        return_value=LLMResponse(
+            content="not json", token_count=0, cost=0.0, model_used="grok", finish_reason="stop"
+        )
+    )
+    return connector
+
+
+@pytest.mark.parametrize("plan", [PLAN, json.dumps(PLAN, separators=(",", ":"))])
+async def test_verify_payload_embeds_plan(connector, plan):
+    """Plan dicts and pre-serialized plans produce the same payload."""
+    verifier = SpecialistVerifier(connector, None)
+
+    await verifier.verify("14s5p energy?", plan, {"calc": {"status": "success"}}, {})
+
+    payload = json.loads(connector.generate.call_args.kwargs["messages"][1].content)
+    assert payload["plan"] == PLAN
+    assert list(payload)[:4] == ["task", "mode", "original_query", "plan"]
+    assert payload["tool_results"] == {"calc": {"status": "success"}}